@@ -2,40 +2,67 @@
 Audio engine for playback using sounddevice
 """
 
+import queue
+
 import numpy as np
 import sounddevice as sd
 
 
 class AudioEngine:
     """Audio playback engine with play, pause, stop, seek controls"""
-    
+
     def __init__(self):
         self.audio_data = None
+        self._scaled_audio = None  # audio_data pre-multiplied by volume
         self.sample_rate = None
         self.position = 0
         self.volume = 0.8
         self._is_playing = False
         self._is_paused = False
         self.stream = None
-        
+        # Hot-swap buffers are published to the callback thread through this
+        # queue (latest-wins); scalar flags are single attribute stores, which
+        # are atomic under the GIL.
+        self._audio_updates = queue.SimpleQueue()
+
+        # Default to the output device's own low-latency figure; falls back
+        # to the 'low' hint if no device can be queried (e.g. no audio)
+        try:
+            device_info = sd.query_devices(kind='output')
+            self.latency = device_info['default_low_output_latency']
+        except Exception:
+            self.latency = 'low'
+
+    def _scaled(self, data: np.ndarray) -> np.ndarray:
+        """Pre-scales a buffer by the current volume (aliases at unity)"""
+        if self.volume == 1.0:
+            return data
+        return data * np.float32(self.volume)
+
     def load_audio(self, audio_data: np.ndarray, sample_rate: int):
         """Loads audio data for playback"""
         self.stop()
-        self.audio_data = audio_data.astype(np.float32)
+        # No-op when the caller already passes contiguous float32
+        self.audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        self._scaled_audio = self._scaled(self.audio_data)
         self.sample_rate = sample_rate
         self.position = 0
-            
+
     def has_audio(self) -> bool:
         """Checks if there is audio loaded"""
         return self.audio_data is not None
-        
+
     def update_audio(self, audio_data: np.ndarray):
         """Updates audio buffer in real-time (hot-swap)"""
         data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        scaled = self._scaled(data)
         if self._is_playing:
-            self.audio_data = data
+            # Publish to the callback thread; it adopts the newest buffers
+            # at the next block boundary.
+            self._audio_updates.put((data, scaled))
         else:
             self.audio_data = data
+            self._scaled_audio = scaled
 
     def play(self):
         """Starts playback"""
@@ -46,7 +73,7 @@ class AudioEngine:
             try:
                 self.stream.stop()
                 self.stream.close()
-            except:
+            except Exception:
                 pass
             self.stream = None
             
@@ -54,43 +81,47 @@ class AudioEngine:
         self._is_paused = False
         
         def callback(outdata, frames, time, status):
+            if status:
+                print(f"Audio status: {status}")
+
+            if self._is_paused or not self._is_playing:
+                outdata.fill(0)
+                return
+
+            # Adopt the newest hot-swapped buffers, if any (latest-wins)
             try:
-                if status:
-                    print(f"Audio status: {status}")
-                    
-                if self._is_paused or not self._is_playing:
-                    outdata.fill(0)
-                    return
-                
-                current_audio = self.audio_data
-                if current_audio is None:
-                    outdata.fill(0)
-                    return
-
-                audio_len = len(current_audio)
-                pos = self.position
-                end_pos = pos + frames
-                
-                if pos >= audio_len:
-                    outdata.fill(0)
-                    self._is_playing = False
-                    raise sd.CallbackStop()
-                    
-                if end_pos > audio_len:
-                    remaining = audio_len - pos
-                    chunk = current_audio[pos:audio_len]
-                    if len(chunk) > 0:
-                         outdata[:remaining, 0] = chunk * self.volume
-                    outdata[remaining:, 0] = 0
-                    self.position = audio_len
-                else:
-                    chunk = current_audio[pos:end_pos]
-                    outdata[:, 0] = chunk * self.volume
-                    self.position = end_pos
-                    
-            except Exception as e:
-                print(f"Error in audio callback: {e}")
+                while True:
+                    self.audio_data, self._scaled_audio = \
+                        self._audio_updates.get_nowait()
+            except queue.Empty:
+                pass
+
+            current_audio = self._scaled_audio
+            if current_audio is None:
                 outdata.fill(0)
+                return
+
+            audio_len = len(current_audio)
+            pos = self.position
+
+            if pos >= audio_len:
+                # End of stream: flag it and keep emitting silence. The
+                # GUI position timer notices is_playing() dropping and
+                # loops or stops the stream outside the realtime thread,
+                # so no exception is raised in the callback.
+                outdata.fill(0)
+                self._is_playing = False
+                return
+
+            n = min(frames, audio_len - pos)
+
+            # Volume is already baked into the buffer - pure memcpy here
+            np.copyto(outdata[:n, 0], current_audio[pos:pos + n])
+
+            if n < frames:
+                outdata[n:, 0] = 0
+
+            self.position = pos + n
                 
         try:
             self.stream = sd.OutputStream(
@@ -98,8 +129,8 @@ class AudioEngine:
                 channels=1,
                 callback=callback,
                 dtype='float32',
-                blocksize=1024,
-                latency='low'
+                blocksize=0,  # let the host API pick its native period
+                latency=self.latency
             )
             self.stream.start()
         except Exception as e:
@@ -122,12 +153,22 @@ class AudioEngine:
         self._is_playing = False
         self._is_paused = False
         self.position = 0
-        
+
+        # Drop hot-swaps published but not yet adopted; a stale buffer
+        # left in the queue would override the next load_audio the
+        # moment its callback drains the queue
+        try:
+            while True:
+                self._audio_updates.get_nowait()
+        except queue.Empty:
+            pass
+
+
         if self.stream is not None:
             try:
                 self.stream.stop()
                 self.stream.close()
-            except:
+            except Exception:
                 pass
             self.stream = None
                 
@@ -163,10 +204,33 @@ class AudioEngine:
             
         return len(self.audio_data) / self.sample_rate
         
+    def set_latency(self, latency: float):
+        """Sets the requested output latency in seconds (applies on next play)"""
+        self.latency = latency
+
     def set_volume(self, volume: float):
         """Sets volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
+        if self.audio_data is None:
+            return
+        # Re-scale off the realtime thread and publish the new buffer
+        scaled = self._scaled(self.audio_data)
+        if self._is_playing:
+            self._audio_updates.put((self.audio_data, scaled))
+        else:
+            self._scaled_audio = scaled
             
+    def snapshot(self) -> tuple:
+        """Returns (position seconds, is_playing) in one call
+
+        The GUI position timer polls both every tick; one combined getter
+        halves the crossings into the engine.
+        """
+        if self.audio_data is None:
+            return 0.0, False
+        return (self.position / self.sample_rate,
+                self._is_playing and not self._is_paused)
+
     def is_playing(self) -> bool:
         """Checks if playing"""
         return self._is_playing and not self._is_paused
@@ -175,5 +239,5 @@ class AudioEngine:
         """Cleanup on destroy"""
         try:
             self.stop()
-        except:
+        except Exception:
             pass
@@ -2,38 +2,91 @@
 Worker thread for convolution processing
 """
 
+import threading
+from collections import deque
+
 from PyQt6.QtCore import QThread, pyqtSignal
 import numpy as np
 
 
 class ConvolutionWorker(QThread):
     """
-    Separate thread for processing convolution without blocking UI
+    Persistent thread for processing convolution without blocking UI.
+
+    Jobs are submitted into a one-slot latest-wins queue, so a burst of
+    requests (e.g. dragging the mix slider) collapses into a single
+    computation of the newest parameters.
     """
-    
+
     # Signals
-    finished = pyqtSignal(np.ndarray, int)  # audio_data, sample_rate
+    finished = pyqtSignal(np.ndarray, int, object)  # audio, sample_rate, job key
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
-    
-    def __init__(self, convolution_processor, wet_mix: float = 1.0):
+
+    def __init__(self, convolution_processor):
         super().__init__()
         self.convolution_processor = convolution_processor
-        self.wet_mix = wet_mix
-        
+        self._jobs = deque(maxlen=1)  # latest pending (wet_mix, key) only
+        self._wake = threading.Event()
+        self._cancel = threading.Event()
+        self._running = True
+
+    def submit(self, wet_mix: float = 1.0, key=None):
+        """Queues a job, replacing any job that has not started yet
+
+        Also asks any job already in flight to bail out cooperatively:
+        its result would be superseded anyway, so the processor stops at
+        the next partition boundary instead of convolving to completion.
+
+        `key` is an opaque tag identifying the job's parameters; it is
+        emitted back with `finished`, so the receiver can file the
+        result without consulting state that may have changed since.
+        """
+        self._jobs.append((wet_mix, key))
+        self._cancel.set()
+        self._wake.set()
+        if not self.isRunning():
+            self.start()
+
+    def stop(self):
+        """Shuts the worker down and waits for the thread to exit"""
+        self._running = False
+        self._cancel.set()
+        self._wake.set()
+        if self.isRunning():
+            self.wait()
+
     def run(self):
-        """Executes processing in separate thread"""
+        """Consumes jobs until stopped"""
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            while self._jobs:
+                try:
+                    wet_mix, key = self._jobs.popleft()
+                except IndexError:
+                    break
+                self._cancel.clear()
+                self._process(wet_mix, key)
+
+    def _process(self, wet_mix: float, key):
         try:
             self.progress.emit(10)
-            
-            audio_data, sample_rate = self.convolution_processor.process(self.wet_mix)
-            
+
+            audio_data, sample_rate = self.convolution_processor.process(
+                wet_mix, cancel=self._cancel, progress=self.progress.emit)
+
+            if self._cancel.is_set():
+                # Superseded by a newer submission; drop this result
+                # silently - the fresh job is already queued
+                return
+
             self.progress.emit(100)
-            
+
             if audio_data is not None:
-                self.finished.emit(audio_data, sample_rate)
+                self.finished.emit(audio_data, sample_rate, key)
             else:
                 self.error.emit("Error processing convolution - empty result")
-                
+
         except Exception as e:
             self.error.emit(str(e))
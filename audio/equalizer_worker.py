@@ -0,0 +1,61 @@
+"""
+Worker thread for equalizer processing
+"""
+
+import threading
+from collections import deque
+
+from PyQt6.QtCore import QThread, pyqtSignal
+import numpy as np
+
+
+class EqualizerWorker(QThread):
+    """
+    Persistent thread applying the equalizer off the GUI thread.
+
+    Mirrors ConvolutionWorker: jobs go into a one-slot latest-wins queue,
+    so a storm of gain changes collapses into a single filter pass over
+    the newest settings instead of blocking paint/input events per tick.
+    """
+
+    # Signals
+    finished = pyqtSignal(np.ndarray)  # processed audio
+    error = pyqtSignal(str)
+
+    def __init__(self, equalizer):
+        super().__init__()
+        self.equalizer = equalizer
+        self._jobs = deque(maxlen=1)  # latest (audio, sample_rate, gains)
+        self._wake = threading.Event()
+        self._running = True
+
+    def submit(self, audio_data, sample_rate, gains):
+        """Queues a job, replacing any job that has not started yet"""
+        self._jobs.append((audio_data, sample_rate, list(gains)))
+        self._wake.set()
+        if not self.isRunning():
+            self.start()
+
+    def stop(self):
+        """Shuts the worker down and waits for the thread to exit"""
+        self._running = False
+        self._wake.set()
+        if self.isRunning():
+            self.wait()
+
+    def run(self):
+        """Consumes jobs until stopped"""
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            while self._jobs:
+                try:
+                    audio_data, sample_rate, gains = self._jobs.popleft()
+                except IndexError:
+                    break
+                try:
+                    processed = self.equalizer.process_frame(
+                        audio_data, sample_rate, gains)
+                    self.finished.emit(processed)
+                except Exception as e:
+                    self.error.emit(str(e))
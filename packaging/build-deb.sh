@@ -125,6 +125,7 @@ copy_app_files() {
     cp "${PROJECT_DIR}/requirements.txt" "${INSTALL_DIR}/"
     cp -r "${PROJECT_DIR}/audio" "${INSTALL_DIR}/"
     cp -r "${PROJECT_DIR}/ui" "${INSTALL_DIR}/"
+    cp -r "${PROJECT_DIR}/resources" "${INSTALL_DIR}/"
     
     # Copy sample directory if it exists
     if [ -d "${PROJECT_DIR}/sample" ]; then
@@ -1,12 +1,14 @@
 
+import functools
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QSlider, QLabel, QPushButton, 
     QGroupBox, QWidget, QCheckBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 
 class EqualizerDialog(QDialog):
-    # Signal emitted when any gain changes: list of 10 floats (dB)
+    # Signal emitted when any gain changes: list of 10 ints (dB)
     gains_changed = pyqtSignal(list)
     # Signal emitted when EQ is enabled/disabled
     eq_toggled = pyqtSignal(bool)
@@ -17,10 +19,20 @@ class EqualizerDialog(QDialog):
         self.setFixedWidth(600)
         self.setFixedHeight(380) # Increased a bit to fit the checkbox
         
-        # Initial gains (flat)
-        self.current_gains = [0.0] * 10
+        # Initial gains (flat). Slider values are integers in [-12, 12] and
+        # are kept as ints - they hash and compare faster as cache keys and
+        # the designer converts to dB floats only at the end.
+        self.current_gains = [0] * 10
         self.sliders = []
-        
+        self.value_labels = []
+
+        # Coalesces valueChanged storms from slider drags into a single
+        # gains_changed emission (each restart resets the deadline)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(15)
+        self._emit_timer.timeout.connect(self._emit_gains)
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -34,23 +46,24 @@ class EqualizerDialog(QDialog):
         for i, freq_label in enumerate(bands):
             band_container = QVBoxLayout()
             
+            # Value Label (dB)
+            val_label = QLabel("0")
+            val_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            val_label.setStyleSheet("color: #0078d4; font-weight: bold;")
+            self.value_labels.append(val_label)
+
             # Slider
             slider = QSlider(Qt.Orientation.Vertical)
             slider.setRange(-12, 12) # +/- 12dB
             slider.setValue(0)
             slider.setTickPosition(QSlider.TickPosition.TicksBothSides)
             slider.setTickInterval(3)
-            # Store band index in slider
-            slider.setProperty("band_index", i)
-            slider.valueChanged.connect(self.on_slider_changed)
+            # Band index and label are bound at connect time - no sender()
+            # introspection or dynamic property lookups per value change
+            slider.valueChanged.connect(
+                functools.partial(self.on_slider_changed, i, val_label))
             self.sliders.append(slider)
             
-            # Value Label (dB)
-            val_label = QLabel("0")
-            val_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            val_label.setStyleSheet("color: #0078d4; font-weight: bold;")
-            slider.setProperty("label_widget", val_label)
-            
             # Frequency Label
             freq_lbl = QLabel(freq_label)
             freq_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -103,28 +116,27 @@ class EqualizerDialog(QDialog):
             slider.setEnabled(checked)
         self.eq_toggled.emit(checked)
         
-    def on_slider_changed(self, value):
-        slider = self.sender()
-        index = slider.property("band_index")
-        label = slider.property("label_widget")
-        
+    def on_slider_changed(self, index, label, value):
         # Update label
         prefix = "+" if value > 0 else ""
         label.setText(f"{prefix}{value}")
         
         # Update internal state
-        self.current_gains[index] = float(value)
-        
-        # Emit signal
+        self.current_gains[index] = value
+
+        # Label updates stay immediate; the emission is debounced
+        self._emit_timer.start()
+
+    def _emit_gains(self):
         self.gains_changed.emit(self.current_gains)
         
     def reset_flat(self):
-        for slider in self.sliders:
+        for slider, label in zip(self.sliders, self.value_labels):
             slider.blockSignals(True)
             slider.setValue(0)
-            label = slider.property("label_widget")
             label.setText("0")
             slider.blockSignals(False)
             
-        self.current_gains = [0.0] * 10
+        self.current_gains = [0] * 10
+        self._emit_timer.stop()  # flat wins over any pending drag emission
         self.gains_changed.emit(self.current_gains)
@@ -0,0 +1,88 @@
+"""
+Worker thread for exporting IR files
+"""
+
+import os
+import shutil
+
+from PyQt6.QtCore import QThread, pyqtSignal
+import numpy as np
+import soundfile as sf
+
+
+class ExportWorker(QThread):
+    """
+    Copies (and optionally normalizes) a batch of IR files off the GUI
+    thread, emitting progress per file. shutil.copy2 already picks the
+    fastest copy backend the platform offers (copy_file_range / clones).
+    """
+
+    # Signals
+    progress = pyqtSignal(int)  # files completed so far
+    finished = pyqtSignal(int, int)  # success_count, error_count
+
+    def __init__(self, files, dest_folder, do_normalize=False,
+                 norm_type="peak", target_rms_db=-18):
+        super().__init__()
+        self.files = files
+        self.dest_folder = dest_folder
+        self.do_normalize = do_normalize
+        self.norm_type = norm_type
+        self.target_rms_db = target_rms_db
+
+    def run(self):
+        success_count = 0
+        error_count = 0
+
+        for i, src_path in enumerate(self.files):
+            try:
+                filename = os.path.basename(src_path)
+                dst_path = os.path.join(self.dest_folder, filename)
+
+                if os.path.exists(dst_path):
+                    base, ext = os.path.splitext(filename)
+                    counter = 1
+                    while os.path.exists(dst_path):
+                        dst_path = os.path.join(self.dest_folder, f"{base}_{counter}{ext}")
+                        counter += 1
+
+                if self.do_normalize:
+                    self._export_normalized_ir(src_path, dst_path)
+                else:
+                    shutil.copy2(src_path, dst_path)
+
+                success_count += 1
+            except Exception as e:
+                print(f"Error processing {src_path}: {e}")
+                error_count += 1
+
+            self.progress.emit(i + 1)
+
+        self.finished.emit(success_count, error_count)
+
+    def _export_normalized_ir(self, src_path, dst_path):
+        """Normalizes and exports a single IR file"""
+        data, sample_rate = sf.read(src_path, dtype='float32')
+
+        if len(data.shape) > 1:
+            data = np.mean(data, axis=1)
+
+        if self.norm_type == "peak":
+            peak = np.max(np.abs(data))
+            if peak > 0:
+                data = data / peak
+        else:
+            rms = np.sqrt(np.mean(data ** 2))
+            if rms > 0:
+                target_rms = 10 ** (self.target_rms_db / 20)
+                scale = target_rms / rms
+                data = data * scale
+
+                peak = np.max(np.abs(data))
+                if peak > 0.99:
+                    data = data * (0.99 / peak)  # Prevent clipping
+
+        info = sf.info(src_path)
+        subtype = info.subtype
+
+        sf.write(dst_path, data, sample_rate, subtype=subtype)
@@ -0,0 +1,81 @@
+"""
+Worker thread for scanning IR/DI folders
+"""
+
+import os
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class FolderScanWorker(QThread):
+    """
+    One-shot thread walking a folder tree off the GUI thread.
+
+    The walk produces the same (new file keys, per-directory listings)
+    pair the window's attach step consumes, so scanning a large library
+    (or a slow network share) never freezes the UI. Interruption is
+    checked per directory; an interrupted scan emits nothing.
+    """
+
+    # Signals
+    scanned = pyqtSignal(dict, dict)  # new key->path entries, listings
+
+    EXTENSIONS = frozenset(('wav', 'aiff', 'flac', 'mp3'))
+
+    def __init__(self, folder, existing_keys):
+        super().__init__()
+        self.folder = folder
+        # Snapshot of the keys already present, taken on the GUI thread
+        self.existing = set(existing_keys)
+
+    def run(self):
+        folder_name = os.path.basename(self.folder)
+        new_items = {}
+        listings = {}
+
+        # Iterative scandir walk: DirEntry type checks reuse the stat
+        # returned by the directory read (no second syscall per entry)
+        # and hidden directories are pruned before descending
+        stack = [(self.folder, "")]
+        while stack:
+            if self.isInterruptionRequested():
+                return
+            root, rel_root = stack.pop()
+
+            dirs = []
+            files = []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                dirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.name)
+            except OSError:
+                continue
+            dirs.sort()
+            files.sort()
+
+            file_entries = []
+            for filename in files:
+                if filename.rpartition('.')[2].lower() in self.EXTENSIONS:
+                    filepath = os.path.join(root, filename)
+
+                    if rel_root:
+                        key = f"{folder_name}/{rel_root}/{filename}"
+                    else:
+                        key = f"{folder_name}/{filename}"
+
+                    if key not in self.existing:
+                        self.existing.add(key)
+                        new_items[key] = filepath
+                        file_entries.append((filename, key))
+
+            listings[rel_root] = (dirs, file_entries)
+
+            for dirname in dirs:
+                dir_path = os.path.join(rel_root, dirname) if rel_root else dirname
+                stack.append((os.path.join(root, dirname), dir_path))
+
+        self.scanned.emit(new_items, listings)
@@ -0,0 +1,65 @@
+"""
+Worker thread for IR frequency-response analysis
+"""
+
+import threading
+from collections import deque
+
+from PyQt6.QtCore import QThread, pyqtSignal
+import numpy as np
+
+
+class IRAnalysisWorker(QThread):
+    """
+    Persistent thread computing IR frequency responses off the GUI thread.
+
+    Mirrors ConvolutionWorker: paths are submitted into a one-slot
+    latest-wins queue, so rapid selection changes collapse into a single
+    analysis of the newest file.
+    """
+
+    # Signals
+    finished = pyqtSignal(np.ndarray, np.ndarray)  # frequencies, response dB
+    error = pyqtSignal(str)
+
+    def __init__(self, compute_response):
+        super().__init__()
+        self._compute_response = compute_response
+        self._jobs = deque(maxlen=1)  # latest pending job only
+        self._wake = threading.Event()
+        self._running = True
+
+    def submit(self, file_path: str, data=None, samplerate=None):
+        """Queues a file, replacing any job that has not started yet
+
+        `data`/`samplerate` optionally carry the already-decoded samples
+        so the analysis can skip its own disk read.
+        """
+        self._jobs.append((file_path, data, samplerate))
+        self._wake.set()
+        if not self.isRunning():
+            self.start()
+
+    def stop(self):
+        """Shuts the worker down and waits for the thread to exit"""
+        self._running = False
+        self._wake.set()
+        if self.isRunning():
+            self.wait()
+
+    def run(self):
+        """Consumes jobs until stopped"""
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            while self._jobs:
+                try:
+                    file_path, data, samplerate = self._jobs.popleft()
+                except IndexError:
+                    break
+                try:
+                    xf, response_db = self._compute_response(
+                        file_path, data, samplerate)
+                    self.finished.emit(xf, response_db)
+                except Exception as e:
+                    self.error.emit(str(e))
@@ -2,15 +2,20 @@
 Main Window for the IR Tester application
 """
 
+import collections
+import functools
+import threading
+from enum import IntEnum
+
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStackedLayout,
     QTreeWidget, QTreeWidgetItem, QPushButton, QLabel, QSlider, QGroupBox,
     QDialog, QTreeView, QAbstractItemView, QHeaderView, QListView,
     QSplitter, QFrame, QMessageBox, QProgressBar, QTreeWidgetItemIterator, QApplication, QFileDialog,
     QCheckBox, QComboBox, QDialogButtonBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, QTimer, QDir
-from PyQt6.QtGui import QIcon, QFont, QAction
+from PyQt6.QtCore import Qt, QTimer, QDir, QSignalBlocker
+from PyQt6.QtGui import QIcon, QFont, QAction, QPainter, QPixmap
 from PyQt6.QtWidgets import QMenu, QStyle
 
 import matplotlib
@@ -25,28 +30,99 @@ from audio.audio_engine import AudioEngine
 from audio.convolution import ConvolutionProcessor
 from audio.convolution_worker import ConvolutionWorker
 from audio.equalizer import Equalizer
+from audio.equalizer_worker import EqualizerWorker
 from ui.equalizer_dialog import EqualizerDialog
+from ui.export_worker import ExportWorker
+from ui.folder_scan_worker import FolderScanWorker
+from ui.ir_analysis_worker import IRAnalysisWorker
+
+
+class NodeKind(IntEnum):
+    """Tree item classification stored alongside the item's key
+
+    Hot paths (selection, check propagation, removal) dispatch on one
+    int comparison instead of scanning the key string for its
+    "_folder_:"/"_subfolder_:" prefix.
+    """
+    FILE = 0
+    FOLDER = 1
+    SUBFOLDER = 2
+    LOOSE = 3
+
+
+# Secondary item-data role holding the NodeKind tag
+KIND_ROLE = Qt.ItemDataRole.UserRole.value + 1
 
 
 class IRPlotWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
+        self._layout = QStackedLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+        # The matplotlib figure is only built on the first real plot -
+        # first-figure creation costs hundreds of ms and is wasted when
+        # the user never selects an IR. Until then a plain label stands in.
+        self._placeholder = QLabel("Select an IR")
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._placeholder.setStyleSheet("color: #555555; background-color: #1e1e1e;")
+        self._layout.addWidget(self._placeholder)
+
+        self.figure = None
+        self.canvas = None
+        self.ax = None
+        self._bg = None  # cached axes background for blitting
+
+        # Plot-ready responses keyed by (path, mtime)
+        self._response_cache = {}
+        # 20 Hz - 20 kHz slice bounds and frequency axis per (samplerate,
+        # nfft); invariant across IRs recorded at the same rate and length
+        self._band_cache = {}
+
+        # File read + FFT run off the GUI thread; only the draw happens here
+        self._analysis_worker = IRAnalysisWorker(self._compute_response)
+        self._analysis_worker.finished.connect(self._render_response)
+        self._analysis_worker.error.connect(self._on_analysis_error)
+
+    def _ensure_canvas(self):
+        """Builds the figure, canvas and static plot decoration on first use"""
+        if self.canvas is not None:
+            return
+
         self.figure = Figure(figsize=(5, 3), dpi=100, facecolor='#1e1e1e')
         self.canvas = FigureCanvasQTAgg(self.figure)
         self.ax = self.figure.add_subplot(111)
         self.ax.set_facecolor('#1e1e1e')
-        
+
         self._style_axes()
         self._adjust_layout()
-        
-        layout.addWidget(self.canvas)
-        
+
+        # The static parts of the plot (labels, limits, ticks, grid) are
+        # configured once; refreshing only updates the line artist and
+        # blits it over the cached axes background
+        self.ax.set_xlabel('Frequency (Hz)', fontsize=8)
+        self.ax.set_ylabel('Amplitude (dB)', fontsize=8)
+        self.ax.set_title('Frequency Response', color='#cccccc', fontsize=9)
+        self.ax.set_xscale('log')
+        self.ax.set_ylim([-60, 5])
+        self.ax.set_xlim([20, 20000])
+        self.ax.xaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
+
+        (self._line,) = self.ax.plot([], [], color='#0078d4',
+                                     linewidth=1.5, animated=True)
+        self._hint_text = self.ax.text(0.5, 0.5, "Select an IR",
+                                       ha='center', va='center',
+                                       color='#555555',
+                                       transform=self.ax.transAxes,
+                                       animated=True)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        self._layout.addWidget(self.canvas)
+
         # Connect resize event to adjust layout
         self.canvas.mpl_connect('resize_event', self._on_resize)
-    
+
+
     def _adjust_layout(self):
         """Adjusts figure layout with balanced margins"""
         self.figure.tight_layout(pad=0.5)
@@ -68,7 +144,8 @@ class IRPlotWidget(QWidget):
                 self.figure.subplots_adjust(top=0.85, bottom=0.22)
             elif height < 200:
                 self.figure.subplots_adjust(top=0.87, bottom=0.18)
-            
+
+            self._bg = None  # geometry changed - background is stale
             self.canvas.draw_idle()
         except Exception:
             pass
@@ -84,54 +161,148 @@ class IRPlotWidget(QWidget):
         self.ax.yaxis.label.set_color('#888888')
         self.ax.grid(True, color='#333333', linestyle='--', linewidth=0.5)
 
-    def plot_ir(self, file_path):
-        """Calculates and plots the IR frequency response"""
-        try:
-            data, samplerate = sf.read(file_path)
-            
-            if len(data.shape) > 1:
-                data = np.mean(data, axis=1)
-                
-            n = len(data)
-            yf = scipy.fft.fft(data)
-            xf = scipy.fft.fftfreq(n, 1 / samplerate)
-            
-            # Use only positive frequencies
-            half_n = n // 2
-            xf = xf[:half_n]
-            magnitude = np.abs(yf[:half_n])
-            
-            magnitude = np.where(magnitude == 0, 1e-10, magnitude)  # Avoid log(0)
-            
-            response_db = 20 * np.log10(magnitude)
-            max_db = np.max(response_db)
-            response_db = response_db - max_db  # Normalize peak to 0dB
-            
-            self.ax.clear()
-            self._style_axes()
-            
-            mask = (xf >= 20) & (xf <= 20000)
-            
-            self.ax.semilogx(xf[mask], response_db[mask], color='#0078d4', linewidth=1.5)
-            self.ax.set_xlabel('Frequency (Hz)', fontsize=8)
-            self.ax.set_ylabel('Amplitude (dB)', fontsize=8)
-            self.ax.set_title('Frequency Response', color='#cccccc', fontsize=9)
-            self.ax.set_ylim([-60, 5])
-            self.ax.set_xlim([20, 20000])
-            
-            self.ax.xaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
-            
-            self.canvas.draw()
-            
-        except Exception as e:
-            print(f"Error plotting IR: {e}")
-            self.clear_plot()
+    def _compute_response(self, file_path, data=None, samplerate=None):
+        """Computes the plot-ready (frequencies, dB) arrays for an IR file
+
+        Results are cached by (path, mtime): auditioning means flipping
+        between the same handful of IRs, so repeat selections skip the
+        disk read, FFT and log entirely. The mtime in the key invalidates
+        entries when a file changes on disk. An already-decoded mono
+        `data`/`samplerate` pair may be passed to skip the read as well.
+        """
+        import os
+        key = (file_path, os.path.getmtime(file_path))
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Cap the analysis at ~5.5 s of 48 kHz audio: plenty for any IR
+        # display, and it bounds both the read and the FFT when someone
+        # selects a long stem instead of an impulse response
+        if data is not None:
+            # Caller (the convolution processor) already decoded this
+            # file; a zero-copy slice replaces the second soundfile read.
+            # The magnitude response is normalized to its peak, so the
+            # processor's level normalization does not affect the plot.
+            data = data[:262144]
+        else:
+            with sf.SoundFile(file_path) as f:
+                samplerate = f.samplerate
+                frames = min(len(f), 262144)
+                data = f.read(frames, dtype='float32', always_2d=False)
+
+        if len(data.shape) > 1:
+            if data.shape[1] == 2:
+                # One streamed pass instead of np.mean's sum-then-divide
+                # float64 round trip
+                data = np.add(data[:, 0], data[:, 1])
+                data *= np.float32(0.5)
+            else:
+                # Weighted reduction dispatches to the BLAS gemv path
+                # instead of mean's generic reduce
+                weights = np.full(data.shape[1], 1.0 / data.shape[1],
+                                  dtype=data.dtype)
+                data = np.einsum('ij,j->i', data, weights, optimize=True)
+
+        # Real FFT: half the work and memory of fft + discarding the
+        # negative half, and float32 input keeps pocketfft in single
+        # precision. Zero-padding to the next fast length avoids the
+        # slow path for IRs whose length factors into large primes;
+        # for a magnitude plot the padding is harmless.
+        nfft = scipy.fft.next_fast_len(len(data), real=True)
+        yf = scipy.fft.rfft(data, n=nfft)
+        magnitude = np.abs(yf)
+
+        # dB conversion fused in place on the magnitude buffer: clamp
+        # (avoids log(0)), log and scale reuse the same array instead of
+        # the where/log/subtract chain allocating three intermediates
+        np.maximum(magnitude, 1e-10, out=magnitude)
+        np.log10(magnitude, out=magnitude)
+        magnitude *= 20.0
+        response_db = magnitude
+        response_db -= response_db.max()  # Normalize peak to 0dB
+
+        # The audible-band window depends only on (samplerate, nfft), so
+        # the slice bounds and frequency axis are computed once per
+        # combination; zero-copy slices replace the boolean mask
+        band = self._band_cache.get((samplerate, nfft))
+        if band is None:
+            full_xf = scipy.fft.rfftfreq(nfft, 1 / samplerate)
+            lo = np.searchsorted(full_xf, 20.0)
+            hi = np.searchsorted(full_xf, 20000.0, side='right')
+            band = (lo, hi, full_xf[lo:hi])
+            self._band_cache[(samplerate, nfft)] = band
+        lo, hi, xf = band
+        response_db = response_db[lo:hi]
+
+        # A long IR yields far more FFT bins than the widget has pixels;
+        # max-pool into ~1000 log-spaced bins so the drawn envelope is
+        # identical but matplotlib only rasterizes ~1000 vertices
+        if len(xf) > 2048:
+            edges = np.logspace(np.log10(20), np.log10(20000), 1001)
+            starts = np.unique(np.searchsorted(xf, edges[:-1]))
+            starts = starts[starts < len(xf)]
+            response_db = np.maximum.reduceat(response_db, starts)
+            xf = xf[starts]
+
+        result = (xf, response_db)
+
+        if len(self._response_cache) >= 64:
+            self._response_cache.clear()
+        self._response_cache[key] = result
+        return result
+
+    def plot_ir(self, file_path, data=None, samplerate=None):
+        """Schedules analysis of an IR; the response is drawn when ready
+
+        Passing the already-decoded samples avoids a second disk decode
+        when the caller (the convolution processor) just loaded the file.
+        """
+        self._analysis_worker.submit(file_path, data, samplerate)
+
+    def _on_analysis_error(self, message):
+        print(f"Error plotting IR: {message}")
+        self.clear_plot()
+
+    def _render_response(self, xf, response_db):
+        """Draws a precomputed frequency response (GUI thread)"""
+        self._ensure_canvas()
+        self._layout.setCurrentWidget(self.canvas)
+        self._line.set_data(xf, response_db)
+        self._hint_text.set_visible(False)
+        self._blit()
+
+    def _on_draw(self, event):
+        """Recaptures the axes background after any full redraw"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self._line)
+        self.ax.draw_artist(self._hint_text)
+
+    def _blit(self):
+        """Redraws only the animated artists over the cached background"""
+        if self._bg is None:
+            # No background yet (first show / after resize): full draw,
+            # which recaptures it via the draw_event hook
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+
+    def shutdown(self):
+        """Stops the analysis worker (called when the window closes)"""
+        self._analysis_worker.stop()
 
     def clear_plot(self):
-        self.ax.clear()
-        self._style_axes()
-        self.ax.text(0.5, 0.5, "Select an IR", ha='center', va='center', color='#555555')
-        self.canvas.draw()
+        if self.canvas is None:
+            # Never plotted - the placeholder already shows the hint
+            return
+        self._line.set_data([], [])
+        self._hint_text.set_visible(True)
+        self._blit()
 
 
 class MainWindow(QMainWindow):
@@ -142,34 +313,113 @@ class MainWindow(QMainWindow):
         
         self.audio_engine = AudioEngine()
         self.convolution_processor = ConvolutionProcessor()
-        self.convolution_worker = None
-        
+        self.convolution_worker = ConvolutionWorker(self.convolution_processor)
+        self.convolution_worker.finished.connect(self.on_convolution_finished)
+        self.convolution_worker.error.connect(self.on_convolution_error)
+
         self.header_raw_audio = None
         self.current_sample_rate = 44100
+        self.equalizer = Equalizer()
+        self.equalizer_worker = EqualizerWorker(self.equalizer)
+        self.equalizer_worker.finished.connect(self.audio_engine.update_audio)
+        self.equalizer_worker.error.connect(self.on_equalization_error)
         self.equalizer_dialog = EqualizerDialog(self)
         self.equalizer_dialog.gains_changed.connect(self.update_equalization)
         self.equalizer_dialog.eq_toggled.connect(self.on_eq_toggled)
         
         self.ir_files = {}
         self.di_files = {}
+        # Cached "Loose Files" bucket item per tree, so adding files does
+        # not rescan the top-level items for it on every file
+        self._loose_items = {}
+        # Lazily-added directory items per tree, materialized on expand or
+        # first check. QTreeWidgetItem is unhashable, so entries are keyed
+        # by id(item) -> (item, relative path, recorded listing); holding
+        # the item keeps its wrapper alive, so the id stays unique for as
+        # long as the entry exists
+        self._pending_children = {}
+        # Currently-checked file keys per tree, maintained incrementally by
+        # on_item_checked so export/counters never walk the whole tree
+        self._checked_keys = {}
+        self._export_worker = None
+        # Live FolderScanWorker threads as (worker, tree) pairs; clearing
+        # a tree interrupts the scans still targeting it
+        self._scan_workers = []
+        # Per-tree generation counter, bumped on clear; a scan result
+        # from an older generation is discarded even if its signal was
+        # already queued when the tree was cleared
+        self._scan_generation = {}
+
+        # Finished convolutions keyed by (IR path+mtime, DI path+mtime,
+        # mix percent). Users routinely A/B a handful of IRs at a fixed
+        # mix, and a dict probe is free next to a full convolution.
+        self._conv_cache = collections.OrderedDict()
+        # Content digests per (path, mtime), backing the on-disk
+        # convolution cache that survives restarts
+        self._digest_cache = {}
+        # Gains of the last EQ pass actually submitted, for de-duping
+        # redundant gains_changed emissions
+        self._last_applied_gains = None
+
+        # Emoji markers rasterized once into icons; per-item emoji text
+        # would be re-shaped by the font engine on every paint
+        self._icon_folder_open = self._emoji_icon("📂")
+        self._icon_folder = self._emoji_icon("📁")
+        self._icon_loose_files = self._emoji_icon("📄")
         
         self.current_ir = None
         self.current_di = None
         self.is_playing = False
         self.is_looping = True
-        self.convolution_worker = None
         self._preserve_position = False
         self._saved_position = 0
         self._was_playing = True
         self._last_mix_value = 100
         
+        # Mix preview is throttled, not just debounced: a repeating timer
+        # replays the newest value at a bounded rate mid-drag (the wet
+        # cache makes each replay a cheap re-blend), and the single-shot
+        # trailing timer guarantees the settled value is processed
+        self.mix_throttle_timer = QTimer()
+        self.mix_throttle_timer.setInterval(64)
+        self.mix_throttle_timer.timeout.connect(self._on_mix_throttle_tick)
+        self._mix_dirty = False
         self.mix_debounce_timer = QTimer()
         self.mix_debounce_timer.setSingleShot(True)
         self.mix_debounce_timer.timeout.connect(self._on_mix_debounced)
+
+        # A volume drag fires dozens of slider ticks; only the settled
+        # value needs to cross into the audio backend
+        self.volume_debounce_timer = QTimer()
+        self.volume_debounce_timer.setSingleShot(True)
+        self.volume_debounce_timer.setInterval(40)
+        self.volume_debounce_timer.timeout.connect(self._apply_volume)
+
+        # Arrow-keying through the IR list fires a selection per step;
+        # only the settled selection is worth analyzing and plotting
+        self._pending_plot_ir = None
+        self.ir_plot_timer = QTimer()
+        self.ir_plot_timer.setSingleShot(True)
+        self.ir_plot_timer.setInterval(120)
+        self.ir_plot_timer.timeout.connect(self._plot_pending_ir)
         
         self.position_timer = QTimer()
         self.position_timer.timeout.connect(self.update_position)
         self.position_timer.setInterval(100)
+        # Cursor motion needs no ms precision; the coarse timer lets Qt
+        # batch it with other wakeups instead of firing exactly on time
+        self.position_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._cached_duration = 0.0
+        # Mirrors audio_engine.has_audio(); flips true when the first
+        # convolution result loads and audio is never unloaded after
+        # that, so hot handlers read the attribute instead of crossing
+        # into the engine
+        self._has_audio = False
+        self._last_slider_pos = -1
+        # format_time memo: position ticks resolve to whole seconds, so
+        # most ticks can reuse the previous formatted string
+        self._last_sec = -1
+        self._last_time_str = "00:00"
         
         self.setup_ui()
         self.connect_signals()
@@ -238,6 +488,11 @@ class MainWindow(QMainWindow):
         self.ir_tree = QTreeWidget()
         self.ir_tree.setHeaderHidden(True)
         self.ir_tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        # All rows are one line of text; declaring that lets Qt lay out
+        # and scroll by arithmetic instead of measuring every row
+        self.ir_tree.setUniformRowHeights(True)
+        self.ir_tree.setAnimated(False)
+        self.ir_tree.setExpandsOnDoubleClick(False)
         tree_layout.addWidget(self.ir_tree)
         
         self.ir_info_label = QLabel("No IR selected")
@@ -281,6 +536,9 @@ class MainWindow(QMainWindow):
         self.di_tree = QTreeWidget()
         self.di_tree.setHeaderHidden(True)
         self.di_tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        self.di_tree.setUniformRowHeights(True)
+        self.di_tree.setAnimated(False)
+        self.di_tree.setExpandsOnDoubleClick(False)
         layout.addWidget(self.di_tree)
         
         self.di_info_label = QLabel("No DI selected")
@@ -401,6 +659,16 @@ class MainWindow(QMainWindow):
         
         return frame
         
+    @staticmethod
+    def _emoji_icon(emoji):
+        """Rasterizes an emoji into a small shared QIcon"""
+        pixmap = QPixmap(24, 24)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, emoji)
+        painter.end()
+        return QIcon(pixmap)
+
     def connect_signals(self):
         self.btn_export_marked.clicked.connect(self.export_marked_irs)
         self.btn_remove_ir.clicked.connect(self.remove_selected_ir)
@@ -411,6 +679,9 @@ class MainWindow(QMainWindow):
         
         self.ir_tree.currentItemChanged.connect(self.on_ir_selected)
         self.di_tree.currentItemChanged.connect(self.on_di_selected)
+
+        self.ir_tree.itemExpanded.connect(self._populate_on_expand)
+        self.di_tree.itemExpanded.connect(self._populate_on_expand)
         
         self.ir_tree.itemChanged.connect(lambda item, col: self.on_item_checked(item, col, self.ir_tree, self.ir_files, self.ir_counter_label))
         self.di_tree.itemChanged.connect(lambda item, col: self.on_item_checked(item, col, self.di_tree, self.di_files, self.di_counter_label))
@@ -437,27 +708,50 @@ class MainWindow(QMainWindow):
             
         check_state = item.checkState(0)
         key = item.data(0, Qt.ItemDataRole.UserRole)
-        
+        checked_keys = self._checked_keys.setdefault(tree_widget, set())
+
         # If it's a folder, propagate check state to all children
-        if key and (key.startswith("_folder_:") or key.startswith("_subfolder_:") or key == "_loose_files_"):
+        if key and item.data(0, KIND_ROLE) != NodeKind.FILE:
+            # Deferred levels must exist before the state can reach them
+            self._ensure_populated(item)
             tree_widget.blockSignals(True)
-            self._set_children_check_state(item, check_state)
+            self._set_children_check_state(item, check_state, checked_keys)
             tree_widget.blockSignals(False)
-        
+        elif key:
+            if check_state == Qt.CheckState.Checked:
+                checked_keys.add(key)
+            else:
+                checked_keys.discard(key)
+
         # Update parent state based on children
         self._update_parent_check_state(item, tree_widget)
         
         # Update counter
         self.update_file_counter(tree_widget, file_dict, counter_label)
         
-    def _set_children_check_state(self, parent_item, check_state):
-        """Recursively sets check state for all children"""
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
+    def _set_children_check_state(self, parent_item, check_state, checked_keys):
+        """Sets check state for all descendants (iterative DFS)
+
+        An explicit stack replaces per-level recursion, so deep library
+        trees cost one loop instead of a Python call frame per folder.
+        """
+        adding = check_state == Qt.CheckState.Checked
+        stack = [parent_item.child(i)
+                 for i in range(parent_item.childCount())]
+        while stack:
+            child = stack.pop()
             child.setCheckState(0, check_state)
-            # Recursively set children of children
             if child.childCount() > 0:
-                self._set_children_check_state(child, check_state)
+                for i in range(child.childCount()):
+                    stack.append(child.child(i))
+            else:
+                key = child.data(0, Qt.ItemDataRole.UserRole)
+                # Childless subfolders carry a structural key, not a file
+                if key and child.data(0, KIND_ROLE) != NodeKind.SUBFOLDER:
+                    if adding:
+                        checked_keys.add(key)
+                    else:
+                        checked_keys.discard(key)
                 
     def _update_parent_check_state(self, item, tree_widget):
         """Updates parent checkbox based on children states"""
@@ -489,21 +783,11 @@ class MainWindow(QMainWindow):
         
     def update_file_counter(self, tree_widget, file_dict, counter_label):
         """Updates the file counter label for a tree widget"""
-        total_files = 0
-        selected_files = 0
-        
-        iterator = QTreeWidgetItemIterator(tree_widget)
-        while iterator.value():
-            item = iterator.value()
-            key = item.data(0, Qt.ItemDataRole.UserRole)
-            
-            # Only count actual files, not folders
-            if key and not key.startswith("_folder_:") and not key.startswith("_subfolder_:") and key != "_loose_files_":
-                total_files += 1
-                if item.checkState(0) == Qt.CheckState.Checked:
-                    selected_files += 1
-            iterator += 1
-        
+        # The file dict holds exactly the file keys and the checked set is
+        # maintained incrementally, so no tree walk is needed
+        total_files = len(file_dict)
+        selected_files = len(self._checked_keys.get(tree_widget, ()))
+
         counter_label.setText(f"{total_files} files | {selected_files} selected")
         
     def open_unified_add_dialog(self, is_ir=True):
@@ -553,34 +837,45 @@ class MainWindow(QMainWindow):
     def add_files_to_tree(self, files, file_dict, tree_widget):
         """Adds individual files to the tree (without parent folder)"""
         import os
+        # Same bulk-insert discipline as add_folder_to_tree: signals and
+        # sorting off, items built detached, one addChildren at the end
+        was_sorting = tree_widget.isSortingEnabled()
+        tree_widget.blockSignals(True)
+        tree_widget.setSortingEnabled(False)
         tree_widget.setUpdatesEnabled(False)
         try:
+            loose_files_item = self._loose_items.get(tree_widget)
+            children = []
             for filepath in files:
                 filename = os.path.basename(filepath)
                 key = f"_files_/{filename}"
-                if key not in file_dict:
-                    file_dict[key] = filepath
-                    
-                    loose_files_item = None
-                    for i in range(tree_widget.topLevelItemCount()):
-                        item = tree_widget.topLevelItem(i)
-                        if item.data(0, Qt.ItemDataRole.UserRole) == "_loose_files_":
-                            loose_files_item = item
-                            break
-                    
-                    if loose_files_item is None:
-                        loose_files_item = QTreeWidgetItem(tree_widget)
-                        loose_files_item.setText(0, "📄 Loose Files")
-                        loose_files_item.setData(0, Qt.ItemDataRole.UserRole, "_loose_files_")
-                        loose_files_item.setExpanded(True)
-                        loose_files_item.setCheckState(0, Qt.CheckState.Unchecked)
-                    
-                    file_item = QTreeWidgetItem(loose_files_item)
-                    file_item.setText(0, filename)
-                    file_item.setData(0, Qt.ItemDataRole.UserRole, key)
-                    file_item.setCheckState(0, Qt.CheckState.Unchecked)
+                if key in file_dict:
+                    continue
+                file_dict[key] = filepath
+
+                if loose_files_item is None:
+                    loose_files_item = QTreeWidgetItem(tree_widget)
+                    loose_files_item.setText(0, "Loose Files")
+                    loose_files_item.setIcon(0, self._icon_loose_files)
+                    loose_files_item.setData(0, Qt.ItemDataRole.UserRole, "_loose_files_")
+                    loose_files_item.setData(0, KIND_ROLE, NodeKind.LOOSE)
+                    loose_files_item.setExpanded(True)
+                    loose_files_item.setCheckState(0, Qt.CheckState.Unchecked)
+                    self._loose_items[tree_widget] = loose_files_item
+
+                file_item = QTreeWidgetItem()
+                file_item.setText(0, filename)
+                file_item.setData(0, Qt.ItemDataRole.UserRole, key)
+                file_item.setData(0, KIND_ROLE, NodeKind.FILE)
+                file_item.setCheckState(0, Qt.CheckState.Unchecked)
+                children.append(file_item)
+
+            if children:
+                loose_files_item.addChildren(children)
         finally:
             tree_widget.setUpdatesEnabled(True)
+            tree_widget.setSortingEnabled(was_sorting)
+            tree_widget.blockSignals(False)
             
         # Update counter after adding files
         if tree_widget == self.ir_tree:
@@ -589,62 +884,62 @@ class MainWindow(QMainWindow):
             self.update_file_counter(tree_widget, file_dict, self.di_counter_label)
                 
     def add_folder_to_tree(self, folder, file_dict, tree_widget):
-        """Adds an entire folder to the tree maintaining structure"""
+        """Adds an entire folder to the tree maintaining structure
+
+        The directory walk runs on a FolderScanWorker thread (slow disks
+        and network shares no longer freeze the window); its result
+        feeds _on_folder_scanned, which merges the keys and builds only
+        the folder's immediate children. Collapsed subdirectories carry
+        a placeholder child and materialize their real items on first
+        expansion, so adding a large library costs the scan, not a
+        widget per file.
+        """
+        worker = FolderScanWorker(folder, file_dict)
+        gen = self._scan_generation.get(tree_widget, 0)
+        worker.scanned.connect(functools.partial(
+            self._on_folder_scanned, folder, file_dict, tree_widget, gen))
+        worker.finished.connect(
+            functools.partial(self._on_scan_worker_done, worker))
+        self._scan_workers.append((worker, tree_widget))
+        worker.start()
+
+    def _on_scan_worker_done(self, worker):
+        """Drops the bookkeeping entry of a finished scan thread"""
+        self._scan_workers = [w for w in self._scan_workers if w[0] is not worker]
+
+    def _on_folder_scanned(self, folder, file_dict, tree_widget, gen,
+                           new_items, listings):
+        """Attaches a scanned folder to its tree (GUI thread)"""
         import os
-        extensions = ('.wav', '.WAV', '.aiff', '.AIFF', '.flac', '.FLAC', '.mp3', '.MP3')
-        
+        if gen != self._scan_generation.get(tree_widget, 0):
+            # The tree was cleared after this scan was queued; its
+            # result must not repopulate the emptied tree and dict
+            return
+        file_dict.update(new_items)
+
         folder_name = os.path.basename(folder)
-        
         folder_item = QTreeWidgetItem(tree_widget)
-        folder_item.setText(0, f"📂 {folder_name}")
+        folder_item.setText(0, folder_name)
+        folder_item.setIcon(0, self._icon_folder_open)
         folder_item.setData(0, Qt.ItemDataRole.UserRole, f"_folder_:{folder}")
+        folder_item.setData(0, KIND_ROLE, NodeKind.FOLDER)
         folder_item.setExpanded(True)
         folder_item.setCheckState(0, Qt.CheckState.Unchecked)
-        
+
+        # Signals are blocked so per-item setData/setCheckState calls don't
+        # fan out through itemChanged handlers during the bulk insert, and
+        # sorting is suspended so Qt doesn't re-sort after every attach
+        was_sorting = tree_widget.isSortingEnabled()
+        tree_widget.blockSignals(True)
+        tree_widget.setSortingEnabled(False)
         tree_widget.setUpdatesEnabled(False)
         try:
-            path_to_item = {"": folder_item}
-            
-            for root, dirs, files in os.walk(folder):
-                dirs.sort()
-                files.sort()
-                
-                rel_root = os.path.relpath(root, folder)
-                if rel_root == ".":
-                    rel_root = ""
-                
-                parent_item = path_to_item.get(rel_root, folder_item)
-                
-                for dirname in dirs:
-                    if rel_root:
-                        dir_path = os.path.join(rel_root, dirname)
-                    else:
-                        dir_path = dirname
-                    
-                    dir_item = QTreeWidgetItem(parent_item)
-                    dir_item.setText(0, f"📁 {dirname}")
-                    dir_item.setData(0, Qt.ItemDataRole.UserRole, f"_subfolder_:{dir_path}")
-                    dir_item.setCheckState(0, Qt.CheckState.Unchecked)
-                    path_to_item[dir_path] = dir_item
-                
-                for filename in files:
-                    if filename.endswith(extensions):
-                        filepath = os.path.join(root, filename)
-                        
-                        if rel_root:
-                            key = f"{folder_name}/{rel_root}/{filename}"
-                        else:
-                            key = f"{folder_name}/{filename}"
-                        
-                        if key not in file_dict:
-                            file_dict[key] = filepath
-                            
-                            file_item = QTreeWidgetItem(parent_item)
-                            file_item.setText(0, filename)
-                            file_item.setData(0, Qt.ItemDataRole.UserRole, key)
-                            file_item.setCheckState(0, Qt.CheckState.Unchecked)
+            pending = self._pending_children.setdefault(tree_widget, {})
+            self._attach_listing(folder_item, "", listings, pending)
         finally:
             tree_widget.setUpdatesEnabled(True)
+            tree_widget.setSortingEnabled(was_sorting)
+            tree_widget.blockSignals(False)
             
         # Update counter after adding folder
         if tree_widget == self.ir_tree:
@@ -652,23 +947,104 @@ class MainWindow(QMainWindow):
         else:
             self.update_file_counter(tree_widget, file_dict, self.di_counter_label)
                         
+    def _attach_listing(self, parent_item, rel_root, listings, pending):
+        """Builds one directory level of items under parent_item
+
+        Subdirectories with content get a placeholder child and a
+        pending entry instead of their real subtree; _populate_item
+        expands them from the recorded listing on demand. Items are
+        built detached and attached in one addChildren call - the Qt
+        idiom for bulk insert.
+        """
+        import os
+        dirs, file_entries = listings.get(rel_root, ((), ()))
+        children = []
+
+        for dirname in dirs:
+            dir_path = os.path.join(rel_root, dirname) if rel_root else dirname
+
+            dir_item = QTreeWidgetItem()
+            dir_item.setText(0, dirname)
+            dir_item.setIcon(0, self._icon_folder)
+            dir_item.setData(0, Qt.ItemDataRole.UserRole, f"_subfolder_:{dir_path}")
+            dir_item.setData(0, KIND_ROLE, NodeKind.SUBFOLDER)
+            dir_item.setCheckState(0, Qt.CheckState.Unchecked)
+
+            sub = listings.get(dir_path)
+            if sub and (sub[0] or sub[1]):
+                placeholder = QTreeWidgetItem()
+                placeholder.setText(0, "…")
+                dir_item.addChild(placeholder)
+                pending[id(dir_item)] = (dir_item, dir_path, listings)
+
+            children.append(dir_item)
+
+        for filename, key in file_entries:
+            file_item = QTreeWidgetItem()
+            file_item.setText(0, filename)
+            file_item.setData(0, Qt.ItemDataRole.UserRole, key)
+            file_item.setData(0, KIND_ROLE, NodeKind.FILE)
+            file_item.setCheckState(0, Qt.CheckState.Unchecked)
+            children.append(file_item)
+
+        if children:
+            parent_item.addChildren(children)
+
+    def _populate_on_expand(self, item):
+        """Materializes a lazily-added directory when it is expanded"""
+        tree_widget = item.treeWidget()
+        pending = self._pending_children.get(tree_widget)
+        if pending and id(item) in pending:
+            self._populate_item(item, pending)
+
+    def _populate_item(self, item, pending):
+        """Replaces an item's placeholder child with its real subtree level"""
+        _, dir_path, listings = pending.pop(id(item))
+        tree_widget = item.treeWidget()
+        tree_widget.blockSignals(True)
+        tree_widget.setUpdatesEnabled(False)
+        try:
+            item.takeChildren()  # drops the placeholder
+            self._attach_listing(item, dir_path, listings, pending)
+            # A folder checked while collapsed passes its state on to the
+            # children it just grew
+            if item.checkState(0) == Qt.CheckState.Checked:
+                checked_keys = self._checked_keys.setdefault(tree_widget, set())
+                self._set_children_check_state(
+                    item, Qt.CheckState.Checked, checked_keys)
+        finally:
+            tree_widget.setUpdatesEnabled(True)
+            tree_widget.blockSignals(False)
+
+    def _ensure_populated(self, item):
+        """Materializes every pending descendant of item
+
+        Check-state propagation and structural removal walk real child
+        items, so they force the deferred levels into existence first.
+        """
+        tree_widget = item.treeWidget()
+        pending = self._pending_children.get(tree_widget)
+        if not pending:
+            return
+        stack = [item]
+        while stack:
+            it = stack.pop()
+            if id(it) in pending:
+                self._populate_item(it, pending)
+            for i in range(it.childCount()):
+                stack.append(it.child(i))
+
     def export_marked_irs(self):
         """Exports checked IRs to a folder with optional normalization"""
         import os
-        import shutil
         
+        # The checked-key set makes this a dict lookup per marked file
+        # instead of a full tree walk
         marked_files = []
-        
-        iterator = QTreeWidgetItemIterator(self.ir_tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.checkState(0) == Qt.CheckState.Checked:
-                key = item.data(0, Qt.ItemDataRole.UserRole)
-                if key and not key.startswith("_folder_:") and not key.startswith("_subfolder_:") and key != "_loose_files_":
-                    filepath = self.ir_files.get(key)
-                    if filepath and os.path.exists(filepath):
-                        marked_files.append(filepath)
-            iterator += 1
+        for key in sorted(self._checked_keys.get(self.ir_tree, ())):
+            filepath = self.ir_files.get(key)
+            if filepath and os.path.exists(filepath):
+                marked_files.append(filepath)
             
         if not marked_files:
             QMessageBox.information(self, "Export", "No files selected for export.")
@@ -735,79 +1111,35 @@ class MainWindow(QMainWindow):
         norm_type = norm_type_combo.currentData()
         target_rms_db = target_spin.value()
             
-        success_count = 0
-        error_count = 0
-        
         progress = QProgressBar(self)
         progress.setWindowTitle("Exporting...")
         progress.setWindowModality(Qt.WindowModality.ApplicationModal)
         progress.setMinimum(0)
         progress.setMaximum(len(marked_files))
         progress.show()
-        
-        for i, src_path in enumerate(marked_files):
-            try:
-                filename = os.path.basename(src_path)
-                dst_path = os.path.join(dest_folder, filename)
-                
-                if os.path.exists(dst_path):
-                    base, ext = os.path.splitext(filename)
-                    counter = 1
-                    while os.path.exists(dst_path):
-                        dst_path = os.path.join(dest_folder, f"{base}_{counter}{ext}")
-                        counter += 1
-                
-                if do_normalize:
-                    self._export_normalized_ir(src_path, dst_path, norm_type, target_rms_db)
-                else:
-                    shutil.copy2(src_path, dst_path)
-                    
-                success_count += 1
-            except Exception as e:
-                print(f"Error processing {src_path}: {e}")
-                error_count += 1
-            
-            progress.setValue(i + 1)
-            QApplication.processEvents()
-            
-        progress.close()
-        
-        msg = f"Export complete!\n\n{success_count} files exported successfully."
-        if do_normalize:
-            msg += f"\n\nNormalization: {norm_type.upper()}"
-            if norm_type == "rms":
-                msg += f" (target: {target_rms_db} dB)"
-        if error_count > 0:
-            msg += f"\n{error_count} errors."
-            
-        QMessageBox.information(self, "Export", msg)
-    
-    def _export_normalized_ir(self, src_path, dst_path, norm_type, target_rms_db):
-        """Normalizes and exports a single IR file"""
-        data, sample_rate = sf.read(src_path, dtype='float32')
-        
-        if len(data.shape) > 1:
-            data = np.mean(data, axis=1)
-        
-        if norm_type == "peak":
-            peak = np.max(np.abs(data))
-            if peak > 0:
-                data = data / peak
-        else:
-            rms = np.sqrt(np.mean(data ** 2))
-            if rms > 0:
-                target_rms = 10 ** (target_rms_db / 20)
-                scale = target_rms / rms
-                data = data * scale
-                
-                peak = np.max(np.abs(data))
-                if peak > 0.99:
-                    data = data * (0.99 / peak)  # Prevent clipping
-        
-        info = sf.info(src_path)
-        subtype = info.subtype
-        
-        sf.write(dst_path, data, sample_rate, subtype=subtype)
+
+        def on_export_finished(success_count, error_count):
+            progress.close()
+            self._export_worker = None
+
+            msg = f"Export complete!\n\n{success_count} files exported successfully."
+            if do_normalize:
+                msg += f"\n\nNormalization: {norm_type.upper()}"
+                if norm_type == "rms":
+                    msg += f" (target: {target_rms_db} dB)"
+            if error_count > 0:
+                msg += f"\n{error_count} errors."
+
+            QMessageBox.information(self, "Export", msg)
+
+        # Copies and normalization run off the GUI thread; the progress
+        # bar is fed through a signal instead of processEvents pumping
+        self._export_worker = ExportWorker(marked_files, dest_folder,
+                                           do_normalize, norm_type,
+                                           target_rms_db)
+        self._export_worker.progress.connect(progress.setValue)
+        self._export_worker.finished.connect(on_export_finished)
+        self._export_worker.start()
 
     def remove_selected_ir(self):
         self.remove_checked_items(self.ir_tree, self.ir_files)
@@ -839,13 +1171,25 @@ class MainWindow(QMainWindow):
         for item in items_to_remove:
             key = item.data(0, Qt.ItemDataRole.UserRole)
             if key:
-                if key.startswith("_folder_:") or key.startswith("_subfolder_:") or key == "_loose_files_":
+                if item.data(0, KIND_ROLE) != NodeKind.FILE:
                     self._remove_folder_content_from_dict(item, file_dict)
                 else:
                     if key in file_dict:
                         del file_dict[key]
         
+        pending = self._pending_children.get(tree_widget)
         for item in items_to_remove:
+            if item is self._loose_items.get(tree_widget):
+                del self._loose_items[tree_widget]
+            if pending:
+                # Drop pending entries for the removed subtree so the map
+                # does not keep references to deleted items
+                stack = [item]
+                while stack:
+                    it = stack.pop()
+                    pending.pop(id(it), None)
+                    for i in range(it.childCount()):
+                        stack.append(it.child(i))
             try:
                 parent = item.parent()
                 if parent:
@@ -857,6 +1201,11 @@ class MainWindow(QMainWindow):
             except RuntimeError:
                 pass
         
+        # Drop removed keys from the checked set
+        checked_keys = self._checked_keys.get(tree_widget)
+        if checked_keys:
+            checked_keys.intersection_update(file_dict)
+
         # Update counter after removal
         if tree_widget == self.ir_tree:
             self.update_file_counter(tree_widget, self.ir_files, self.ir_counter_label)
@@ -864,56 +1213,126 @@ class MainWindow(QMainWindow):
             self.update_file_counter(tree_widget, self.di_files, self.di_counter_label)
 
     def _remove_folder_content_from_dict(self, folder_item, file_dict):
-        """Recursively removes all files from a folder from the dictionary"""""
-        for i in range(folder_item.childCount()):
-            child = folder_item.child(i)
-            key = child.data(0, Qt.ItemDataRole.UserRole)
-            if key:
-                if not key.startswith("_folder_:") and not key.startswith("_subfolder_:") and key != "_loose_files_":
-                    if key in file_dict:
-                        del file_dict[key]
-                else:
-                    self._remove_folder_content_from_dict(child, file_dict)
+        """Removes all of a folder item's files from the dictionary
+
+        File keys embed their folder path ("folder/rel/file" or
+        "_files_/file"), so one prefix scan over the dict replaces the
+        recursive walk of the Qt child items.
+        """
+        import os
+        key = folder_item.data(0, Qt.ItemDataRole.UserRole)
+        kind = folder_item.data(0, KIND_ROLE)
+
+        if kind == NodeKind.LOOSE:
+            prefix = "_files_/"
+        elif kind == NodeKind.FOLDER:
+            prefix = os.path.basename(key[len("_folder_:"):]) + "/"
+        elif kind == NodeKind.SUBFOLDER:
+            # Climb to the top-level folder item for the key's first segment
+            top = folder_item.parent()
+            while top is not None and top.data(0, KIND_ROLE) == NodeKind.SUBFOLDER:
+                top = top.parent()
+            if top is None or top.data(0, KIND_ROLE) != NodeKind.FOLDER:
+                return
+            top_key = top.data(0, Qt.ItemDataRole.UserRole)
+            folder_name = os.path.basename(top_key[len("_folder_:"):])
+            prefix = f"{folder_name}/{key[len('_subfolder_:'):]}/"
+        else:
+            return
+
+        dead = [k for k in file_dict if k.startswith(prefix)]
+        for k in dead:
+            del file_dict[k]
 
 
             
+    def _fast_clear(self, tree):
+        """Clears a tree with repaints suspended
+
+        Item teardown is one batch under a single disabled-updates
+        window, so clearing a large library repaints once instead of
+        after every removed row.
+        """
+        tree.setUpdatesEnabled(False)
+        try:
+            tree.clear()
+        finally:
+            tree.setUpdatesEnabled(True)
+
     def clear_ir_list(self):
+        self._scan_generation[self.ir_tree] = \
+            self._scan_generation.get(self.ir_tree, 0) + 1
+        for worker, tree in self._scan_workers:
+            if tree is self.ir_tree:
+                worker.requestInterruption()
         self.ir_files.clear()
-        self.ir_tree.clear()
+        self._fast_clear(self.ir_tree)
+        self._loose_items.pop(self.ir_tree, None)
+        self._checked_keys.pop(self.ir_tree, None)
+        self._pending_children.pop(self.ir_tree, None)
         self.current_ir = None
         self.ir_info_label.setText("No IR selected")
         self.ir_counter_label.setText("0 files | 0 selected")
         
     def clear_di_list(self):
+        self._scan_generation[self.di_tree] = \
+            self._scan_generation.get(self.di_tree, 0) + 1
+        for worker, tree in self._scan_workers:
+            if tree is self.di_tree:
+                worker.requestInterruption()
         self.di_files.clear()
-        self.di_tree.clear()
+        self._fast_clear(self.di_tree)
+        self._loose_items.pop(self.di_tree, None)
+        self._checked_keys.pop(self.di_tree, None)
+        self._pending_children.pop(self.di_tree, None)
         self.current_di = None
         self.di_info_label.setText("No DI selected")
         self.di_counter_label.setText("0 files | 0 selected")
         
+    def _plot_pending_ir(self):
+        """Plots the IR the selection settled on"""
+        if self._pending_plot_ir:
+            self.ir_plot_widget.plot_ir(*self._pending_plot_ir)
+
     def on_ir_selected(self, current, previous):
         if current:
             key = current.data(0, Qt.ItemDataRole.UserRole)
-            if key and not key.startswith("_folder_:") and not key.startswith("_subfolder_:") and key != "_loose_files_":
+            if key and current.data(0, KIND_ROLE) == NodeKind.FILE:
                 filepath = self.ir_files.get(key)
                 if filepath:
+                    if filepath == self.current_ir:
+                        # Qt re-emits currentItemChanged on refocus and
+                        # expand/collapse; the same IR needs no reload,
+                        # re-plot or re-convolution
+                        return
                     self.current_ir = filepath
                     info = self.convolution_processor.load_ir(filepath)
                     self.ir_info_label.setText(f"✓ {info}")
-                    self.ir_plot_widget.plot_ir(filepath)
+                    # Hand the processor's decode to the plot so the
+                    # analysis worker does not read the file again
+                    self._pending_plot_ir = (
+                        filepath,
+                        self.convolution_processor.ir_data,
+                        self.convolution_processor.ir_sample_rate,
+                    )
+                    self.ir_plot_timer.start()
                     self.process_and_play(preserve_position=True)
             else:
+                self.ir_plot_timer.stop()
                 self.ir_plot_widget.clear_plot()
         else:
             self.ir_info_label.setText("No IR selected")
+            self.ir_plot_timer.stop()
             self.ir_plot_widget.clear_plot()
             
     def on_di_selected(self, current, previous):
         if current:
             key = current.data(0, Qt.ItemDataRole.UserRole)
-            if key and not key.startswith("_folder_:") and not key.startswith("_subfolder_:") and key != "_loose_files_":
+            if key and current.data(0, KIND_ROLE) == NodeKind.FILE:
                 filepath = self.di_files.get(key)
                 if filepath:
+                    if filepath == self.current_di:
+                        return
                     self.current_di = filepath
                     info = self.convolution_processor.load_di(filepath)
                     self.di_info_label.setText(f"✓ {info}")
@@ -924,34 +1343,142 @@ class MainWindow(QMainWindow):
     def process_and_play(self, preserve_position=False):
         if self.current_ir and self.current_di:
             self._preserve_position = preserve_position
-            if preserve_position and self.audio_engine.has_audio():
+            if preserve_position and self._has_audio:
                 self._saved_position = self.audio_engine.get_position()
                 self._was_playing = self.is_playing
             else:
                 self._saved_position = 0
                 self._was_playing = True
             
-            if self.convolution_worker is not None and self.convolution_worker.isRunning():
-                self.convolution_worker.terminate()
-                self.convolution_worker.wait()
-            
+            cache_key = self._conv_cache_key()
+            cached = self._conv_cache.get(cache_key)
+            if cached is not None:
+                # Same (IR, DI, mix) tuple as a previous run - skip the
+                # worker entirely and feed the remembered result straight in
+                self._conv_cache.move_to_end(cache_key)
+                self.on_convolution_finished(*cached)
+                return
+
+            cached = self._load_disk_conv(cache_key)
+            if cached is not None:
+                # Heard in an earlier session: replay from the disk cache
+                self._conv_cache[cache_key] = cached
+                self.on_convolution_finished(*cached)
+                return
+
+            # The key rides along with the job and comes back with the
+            # finished signal, so a result is always cached under the
+            # parameters that actually produced it - window state may
+            # have moved on by delivery time
             wet_mix = self.mix_slider.value() / 100.0
-            self.convolution_worker = ConvolutionWorker(self.convolution_processor, wet_mix)
-            self.convolution_worker.finished.connect(self.on_convolution_finished)
-            self.convolution_worker.error.connect(self.on_convolution_error)
-            self.convolution_worker.start()
-        
-    def on_convolution_finished(self, audio_data, sample_rate):
+            self.convolution_worker.submit(wet_mix, cache_key)
+
+    def _conv_cache_key(self):
+        """Builds the convolution cache key for the current selection
+
+        File mtimes are part of the key, so an IR or DI that is edited on
+        disk naturally misses the cache instead of replaying stale audio.
+        """
+        import os
+        try:
+            ir_mtime = os.path.getmtime(self.current_ir)
+            di_mtime = os.path.getmtime(self.current_di)
+        except OSError:
+            ir_mtime = di_mtime = 0
+        return (self.current_ir, ir_mtime, self.current_di, di_mtime,
+                self.mix_slider.value())
+
+    def _file_digest(self, path):
+        """Returns a BLAKE2b content digest, memoized per (path, mtime)"""
+        import os
+        import hashlib
+        key = (path, os.path.getmtime(path))
+        digest = self._digest_cache.get(key)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._digest_cache[key] = digest
+        return digest
+
+    def _disk_conv_stem(self, key):
+        """Cache-file stem for an (IR, DI, mix) cache key
+
+        Names are content-addressed, so an edited file naturally misses,
+        and the sample rate rides along in the final name component.
+        """
+        from pathlib import Path
+        ir_path, _, di_path, _, mix = key
+        cache_dir = Path.home() / ".cache" / "ir-tester"
+        stem = (f"{self._file_digest(ir_path)}_"
+                f"{self._file_digest(di_path)}_"
+                f"{mix:03d}")
+        return cache_dir, stem
+
+    def _load_disk_conv(self, key):
+        """Returns a cached (audio, sample_rate) from disk, or None"""
+        try:
+            cache_dir, stem = self._disk_conv_stem(key)
+            for path in cache_dir.glob(f"{stem}_*.npy"):
+                sample_rate = int(path.stem.rsplit("_", 1)[1])
+                # Read fully into RAM: a memmap-backed buffer would page
+                # fault inside the audio callback on first playback
+                audio = np.load(path)
+                return audio, sample_rate
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_disk_conv(self, audio_data, sample_rate, key):
+        """Writes a finished convolution to the disk cache (off-thread)
+
+        The save and the atime-free LRU prune (oldest mtime first, cap
+        64 entries) run on a daemon thread so the GUI never waits on
+        the filesystem.
+        """
+        try:
+            cache_dir, stem = self._disk_conv_stem(key)
+        except OSError:
+            return
+
+        def write():
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                np.save(cache_dir / f"{stem}_{sample_rate}.npy", audio_data)
+                entries = sorted(cache_dir.glob("*.npy"),
+                                 key=lambda p: p.stat().st_mtime)
+                for stale in entries[:-64]:
+                    stale.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        threading.Thread(target=write, daemon=True).start()
+
+    def on_convolution_finished(self, audio_data, sample_rate, cache_key=None):
+        # cache_key is the key captured at submit time (None when the
+        # result came straight out of a cache), so a stale delivery can
+        # never be filed under parameters it was not computed with
+        if cache_key is not None:
+            self._conv_cache[cache_key] = (audio_data, sample_rate)
+            self._save_disk_conv(audio_data, sample_rate, cache_key)
+            while len(self._conv_cache) > 8:
+                self._conv_cache.popitem(last=False)
         try:
             self.audio_engine.stop()
             self.audio_engine.load_audio(audio_data, sample_rate)
             
-            self.header_raw_audio = audio_data
+            # Contiguous float32 here makes every downstream EQ pass a
+            # zero-copy take; the convolver already emits this layout, so
+            # the conversion is a no-op in practice
+            self.header_raw_audio = np.ascontiguousarray(audio_data,
+                                                         dtype=np.float32)
             self.current_sample_rate = sample_rate
-            
-            self.update_equalization(self.equalizer_dialog.current_gains)
-            
+
             duration = len(audio_data) / sample_rate
+            self._cached_duration = duration
+            self._has_audio = True
             self.duration_label.setText(self.format_time(duration))
             
             if self._preserve_position and self._saved_position > 0:
@@ -970,7 +1497,13 @@ class MainWindow(QMainWindow):
             else:
                 self.is_playing = False
                 self.btn_play_pause.setText("▶")
-            
+
+            # EQ runs after playback has started: the un-EQ'd take plays
+            # immediately and the worker hot-swaps the filtered buffer in
+            # via update_audio once it is ready, hiding the EQ latency
+            self._last_applied_gains = None  # new source: EQ must re-run
+            self.update_equalization(self.equalizer_dialog.current_gains)
+
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error playing: {str(e)}")
             
@@ -978,7 +1511,7 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, "Error", f"Error processing: {error_msg}")
                 
     def toggle_play_pause(self):
-        if self.audio_engine.has_audio():
+        if self._has_audio:
             if self.is_playing:
                 self.audio_engine.pause()
                 self.is_playing = False
@@ -995,33 +1528,39 @@ class MainWindow(QMainWindow):
         self.is_playing = False
         self.btn_play_pause.setText("▶")
         self.position_slider.setValue(0)
+        self._last_slider_pos = 0
         self.time_label.setText("00:00")
         self.position_timer.stop()
         
     def rewind(self):
-        if self.audio_engine.has_audio():
+        if self._has_audio:
             self.audio_engine.seek_relative(-5.0)
             self.update_position()
             
     def forward(self):
-        if self.audio_engine.has_audio():
+        if self._has_audio:
             self.audio_engine.seek_relative(5.0)
             self.update_position()
             
     def update_position(self):
-        if self.audio_engine.has_audio():
-            position = self.audio_engine.get_position()
-            duration = self.audio_engine.get_duration()
-            
+        if self._has_audio:
+            # One combined engine call per tick; duration is fixed per
+            # loaded buffer and cached in on_convolution_finished
+            position, engine_playing = self.audio_engine.snapshot()
+            duration = self._cached_duration
+
             if duration > 0:
                 slider_pos = int((position / duration) * 1000)
-                self.position_slider.blockSignals(True)
-                self.position_slider.setValue(slider_pos)
-                self.position_slider.blockSignals(False)
-                
+                # Sub-pixel moves repaint for nothing; skip them
+                if abs(slider_pos - self._last_slider_pos) >= 2:
+                    self._last_slider_pos = slider_pos
+                    # RAII blocker: one boundary crossing, exception-safe
+                    with QSignalBlocker(self.position_slider):
+                        self.position_slider.setValue(slider_pos)
+
             self.time_label.setText(self.format_time(position))
-            
-            if not self.audio_engine.is_playing() and self.is_playing:
+
+            if not engine_playing and self.is_playing:
                 if self.is_looping:
                     self.audio_engine.seek(0)
                     self.audio_engine.play()
@@ -1034,26 +1573,39 @@ class MainWindow(QMainWindow):
         self.position_timer.stop()
         
     def on_position_slider_released(self):
-        if self.audio_engine.has_audio():
-            duration = self.audio_engine.get_duration()
-            position = (self.position_slider.value() / 1000.0) * duration
+        if self._has_audio:
+            position = (self.position_slider.value() / 1000.0) * self._cached_duration
             self.audio_engine.seek(position)
             if self.is_playing:
                 self.position_timer.start()
                 
     def on_volume_changed(self, value):
         self.volume_label.setText(f"{value}%")
-        self.audio_engine.set_volume(value / 100.0)
+        self.volume_debounce_timer.start()
+
+    def _apply_volume(self):
+        """Pushes the settled volume slider value to the audio engine"""
+        self.audio_engine.set_volume(self.volume_slider.value() / 100.0)
         
     def on_mix_changed(self, value):
         self.mix_label.setText(f"{value}%")
-        self.mix_debounce_timer.stop()
-        self.mix_debounce_timer.start(300)
-        
+        self._mix_dirty = True
+        if not self.mix_throttle_timer.isActive():
+            self.mix_throttle_timer.start()
+            self._on_mix_throttle_tick()  # leading edge: instant preview
+        self.mix_debounce_timer.start(200)
+
+    def _on_mix_throttle_tick(self):
+        """Processes the newest mix value at the throttle rate"""
+        if self._mix_dirty:
+            self._mix_dirty = False
+            if self.current_ir and self.current_di:
+                self.process_and_play(preserve_position=True)
+
     def _on_mix_debounced(self):
         """Called after the mix slider stops being moved"""
-        if self.current_ir and self.current_di:
-            self.process_and_play(preserve_position=True)
+        self.mix_throttle_timer.stop()
+        self._on_mix_throttle_tick()
                     
     def toggle_dry_wet(self):
         current_val = self.mix_slider.value()
@@ -1068,21 +1620,27 @@ class MainWindow(QMainWindow):
             self.btn_dry_wet.setChecked(True)
 
     def update_equalization(self, gains):
-        """Applies equalization to current raw audio and updates the engine"""
+        """Applies equalization to current raw audio and updates the engine
+
+        The filter pass runs on the equalizer worker; the dialog already
+        debounces slider storms, and the worker's latest-wins queue drops
+        any settings superseded before processing starts.
+        """
         if not self.equalizer_dialog.btn_enable.isChecked() or self.header_raw_audio is None:
             return
-            
-        try:
-            processed_audio = Equalizer.process_frame(
-                self.header_raw_audio, 
-                self.current_sample_rate, 
-                gains
-            )
-            
-            self.audio_engine.update_audio(processed_audio)
-            
-        except Exception as e:
-            print(f"Error in equalization: {e}")
+
+        # Redundant valueChanged emissions are common; identical gains
+        # mean an identical result, so skip the whole filter pass
+        g = tuple(gains)
+        if g == self._last_applied_gains:
+            return
+        self._last_applied_gains = g
+
+        self.equalizer_worker.submit(
+            self.header_raw_audio, self.current_sample_rate, gains)
+
+    def on_equalization_error(self, error_msg):
+        print(f"Error in equalization: {error_msg}")
             
     def on_eq_toggled(self, enabled: bool):
         """Called when the enable/disable EQ checkbox is changed"""
@@ -1092,17 +1650,29 @@ class MainWindow(QMainWindow):
         if enabled:
             self.update_equalization(self.equalizer_dialog.current_gains)
         else:
+            self._last_applied_gains = None
             self.audio_engine.update_audio(self.header_raw_audio)
 
     def format_time(self, seconds):
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes:02d}:{secs:02d}"
+        s = int(seconds)
+        if s == self._last_sec:
+            return self._last_time_str
+        minutes, secs = divmod(s, 60)
+        self._last_sec = s
+        self._last_time_str = f"{minutes:02d}:{secs:02d}"
+        return self._last_time_str
         
     def closeEvent(self, event):
         self.audio_engine.stop()
         self.position_timer.stop()
-        if self.convolution_worker is not None and self.convolution_worker.isRunning():
-            self.convolution_worker.terminate()
-            self.convolution_worker.wait()
+        for worker, _tree in self._scan_workers:
+            worker.requestInterruption()
+            worker.wait()
+        if self._export_worker is not None:
+            # Let an in-flight export finish its current file list; a
+            # QThread destroyed while running aborts the process
+            self._export_worker.wait()
+        self.convolution_worker.stop()
+        self.equalizer_worker.stop()
+        self.ir_plot_widget.shutdown()
         event.accept()